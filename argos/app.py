@@ -44,6 +44,8 @@ from argos.wseventhandler import MopidyWSEventHandler
 
 LOGGER = logging.getLogger(__name__)
 
+SESSION_CLOSE_TIMEOUT: int = 2  # s
+
 _ = gettext.gettext
 
 
@@ -393,6 +395,15 @@ class Application(Gtk.Application):
                 task.cancel()
 
         self._loop.call_soon_threadsafe(partial(cancel_tasks, self._tasks))
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._http_session_manager.close(), self._loop
+        )
+        try:
+            future.result(SESSION_CLOSE_TIMEOUT)
+        except Exception as error:
+            LOGGER.warning(f"Failed to close HTTP session: {error}")
+
         self._loop.call_soon_threadsafe(self._loop.stop)
         sleep(0.5)
 
@@ -213,6 +213,9 @@ class LibraryController(ControllerBase):
             assert backend is None
             LOGGER.info(f"Browsing directory {directory.name!r}")
 
+        if force:
+            self._http.invalidate()
+
         refs_dto = await self._http.browse_library(directory_uri)
         if refs_dto is None:
             LOGGER.warning("Failed to browse directory!")
@@ -1,3 +1,4 @@
+import asyncio
 import gettext
 import logging
 from typing import TYPE_CHECKING, Union, cast
@@ -49,11 +50,13 @@ class PlaybackController(ControllerBase):
     @consume(MessageType.IDENTIFY_PLAYING_STATE)
     async def identify_playing_state(self, message: Message) -> None:
         LOGGER.debug("Identifying playing state...")
-        raw_state = await self._http.get_state()
+        raw_state, time_position = await asyncio.gather(
+            self._http.get_state(),
+            self._http.get_time_position(),
+        )
         if raw_state is not None:
             self._model.playback.set_state(raw_state)
 
-        time_position = await self._http.get_time_position()
         if time_position is not None:
             self._model.playback.set_time_position(time_position)
 
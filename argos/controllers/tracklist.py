@@ -1,3 +1,4 @@
+import asyncio
 import gettext
 import logging
 from typing import TYPE_CHECKING, List, cast
@@ -31,19 +32,21 @@ class TracklistController(ControllerBase):
         MessageType.OPTIONS_CHANGED,
     )
     async def get_options(self, message: Message) -> None:
-        consume = await self._http.get_consume()
+        consume, random, repeat, single = await asyncio.gather(
+            self._http.get_consume(),
+            self._http.get_random(),
+            self._http.get_repeat(),
+            self._http.get_single(),
+        )
         if consume is not None:
             self._model.tracklist.set_consume(consume)
 
-        random = await self._http.get_random()
         if random is not None:
             self._model.tracklist.set_random(random)
 
-        repeat = await self._http.get_repeat()
         if repeat is not None:
             self._model.tracklist.set_repeat(repeat)
 
-        single = await self._http.get_single()
         if single is not None:
             self._model.tracklist.set_single(single)
 
@@ -75,9 +78,11 @@ class TracklistController(ControllerBase):
         MessageType.TRACKLIST_CHANGED,
     )
     async def get_tracklist(self, message: Message) -> None:
-        version = await self._http.get_tracklist_version()
+        version, tl_tracks_dto = await asyncio.gather(
+            self._http.get_tracklist_version(),
+            self._http.get_tracklist_tracks(),
+        )
         LOGGER.debug(f"Current tracklist version is {version}")
-        tl_tracks_dto = await self._http.get_tracklist_tracks()
 
         tl_tracks = (
             [
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import TYPE_CHECKING, cast
 
@@ -25,11 +26,13 @@ class MixerController(ControllerBase):
     @consume(MessageType.IDENTIFY_PLAYING_STATE)
     async def identify_mixer_state(self, message: Message) -> None:
         LOGGER.debug("Identifying mixer state...")
-        mute = await self._http.get_mute()
+        mute, volume = await asyncio.gather(
+            self._http.get_mute(),
+            self._http.get_volume(),
+        )
         if mute is not None:
             self._model.mixer.set_mute(mute)
 
-        volume = await self._http.get_volume()
         # When Mopidy-Mixer is disabled on Mopidy server, volume is equal to
         # None; Showing/hiding volume button is based on this...
 
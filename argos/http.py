@@ -4,7 +4,10 @@ Fully implemented using Mopidy websocket.
 
 """
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from gi.repository import GObject
@@ -13,11 +16,14 @@ if TYPE_CHECKING:
     from argos.app import Application
 
 from argos.dto import ImageDTO, PlaylistDTO, RefDTO, TlTrackDTO, TrackDTO, cast_seq_of
-from argos.model import PlaybackState
+from argos.model import Model, PlaybackState
 from argos.ws import MopidyWSConnection
 
 LOGGER = logging.getLogger(__name__)
 
+BROWSE_CACHE_SIZE = 128
+BROWSE_CACHE_EXPIRY = 60  # s
+
 
 class MopidyHTTPClient(GObject.GObject):
     def __init__(
@@ -28,6 +34,28 @@ class MopidyHTTPClient(GObject.GObject):
 
         self._ws: MopidyWSConnection = application.props.ws
 
+        self._browse_cache: "OrderedDict[Optional[str], Tuple[float, List[RefDTO]]]" = (
+            OrderedDict()
+        )
+
+        self._loop: asyncio.AbstractEventLoop = application.loop
+
+        model: Model = application.props.model
+        model.connect(
+            "notify::connected",
+            lambda *_: self._loop.call_soon_threadsafe(self.invalidate),
+        )
+
+    def invalidate(self) -> None:
+        """Forget cached library browsing results.
+
+        The whole cache is cleared since browsing results of
+        subdirectories may be outdated too. Must be called from the
+        event loop thread.
+
+        """
+        self._browse_cache.clear()
+
     # API of Mopidy's core.playback controller
 
     async def get_state(self) -> Optional[str]:
@@ -72,6 +100,14 @@ class MopidyHTTPClient(GObject.GObject):
             uri = None
             # From Mopidy API pov, root directory has null URI
 
+        cached = self._browse_cache.pop(uri, None)
+        if cached is not None:
+            timestamp, refs = cached
+            if time.monotonic() - timestamp < BROWSE_CACHE_EXPIRY:
+                LOGGER.debug(f"Browsing result for {uri!r} found in cache")
+                self._browse_cache[uri] = cached
+                return list(refs)
+
         data = await self._ws.send_command(
             "core.library.browse", params={"uri": uri}, timeout=60
         )
@@ -79,7 +115,14 @@ class MopidyHTTPClient(GObject.GObject):
             return None
 
         refs = cast_seq_of(RefDTO, data)
-        return refs
+        if len(refs) > 0:
+            # an empty directory may just not be ready yet, it must be
+            # browsed again on next visit
+            self._browse_cache[uri] = (time.monotonic(), refs)
+            if len(self._browse_cache) > BROWSE_CACHE_SIZE:
+                self._browse_cache.popitem(last=False)
+
+        return list(refs)
 
     async def lookup_library(
         self, uris: Sequence[str]
@@ -202,9 +245,15 @@ class MopidyHTTPClient(GObject.GObject):
         if uris is None or len(uris) == 0:
             return
 
-        await self._ws.send_command("core.tracklist.clear")
-        await self._ws.send_command("core.tracklist.add", params={"uris": uris})
-        state = await self._ws.send_command("core.playback.get_state")
+        results = await self._ws.send_commands(
+            ("core.tracklist.clear", None),
+            ("core.tracklist.add", {"uris": uris}),
+            ("core.playback.get_state", None),
+        )
+        if results is None:
+            return
+
+        state = results[-1]
         if state != PlaybackState.PLAYING:
             await self._ws.send_command("core.playback.play")
 
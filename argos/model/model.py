@@ -72,6 +72,13 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         self.mixer = MixerModel()
         self.tracklist = TracklistModel()
         self.playlists = Gio.ListStore.new(PlaylistModel)
+        self.playlists.connect("items-changed", self._on_playlists_changed)
+        self._playlists_by_uri: Optional[Dict[str, PlaylistModel]] = None
+        self._playlists_version = 0
+        self._playlists_lock = threading.Lock()
+        # index of playlists, built on lookup and dropped on change;
+        # lookups happen in the event loop thread while changes
+        # happen in the GTK thread
         self.backends = Gio.ListStore.new(MopidyBackend)
 
         self.backends.append(MopidyPodcastBackend())
@@ -394,14 +401,41 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         return self.library.get_track(uri)
 
     def get_playlist(self, uri: str) -> Optional[PlaylistModel]:
-        found_playlist = [p for p in self.playlists if p.uri == uri]
-        if len(found_playlist) == 0:
+        with self._playlists_lock:
+            playlists_by_uri = self._playlists_by_uri
+            version = self._playlists_version
+
+        if playlists_by_uri is None:
+            playlists_by_uri = {}
+            for playlist in self.playlists:
+                if playlist.uri in playlists_by_uri:
+                    LOGGER.warning(f"Ambiguous playlist URI {playlist.uri!r}")
+                    continue
+
+                playlists_by_uri[playlist.uri] = playlist
+
+            with self._playlists_lock:
+                if version == self._playlists_version:
+                    self._playlists_by_uri = playlists_by_uri
+                # otherwise playlists changed while building the index,
+                # which may be outdated and must not be kept
+
+        found_playlist = playlists_by_uri.get(uri)
+        if found_playlist is None:
             LOGGER.debug(f"No playlist found with URI {uri!r}")
-            return None
-        elif len(found_playlist) > 1:
-            LOGGER.warning(f"Ambiguous playlist URI {uri!r}")
 
-        return found_playlist[0]
+        return found_playlist
+
+    def _on_playlists_changed(
+        self,
+        _1: Gio.ListStore,
+        _2: int,
+        _3: int,
+        _4: int,
+    ) -> None:
+        with self._playlists_lock:
+            self._playlists_version += 1
+            self._playlists_by_uri = None
 
     def delete_playlist(self, uri: str) -> None:
         found_playlist = [
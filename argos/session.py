@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+KEEPALIVE_TIMEOUT: int = 60  # s
+
 
 class HTTPSessionManager(GObject.Object):
     def __init__(self, application: "Application"):
@@ -56,6 +58,7 @@ class HTTPSessionManager(GObject.Object):
             if self._session is None or self._session.closed:
                 LOGGER.debug(f"Starting a new HTTP session using {self._session_klass}")
                 self._session = self._session_klass(
+                    connector=aiohttp.TCPConnector(keepalive_timeout=KEEPALIVE_TIMEOUT),
                     raise_for_status=True,
                     headers={"User-Agent": self._user_agent},
                 )
@@ -63,3 +66,17 @@ class HTTPSessionManager(GObject.Object):
         except (ConnectionError, RuntimeError) as error:
             LOGGER.info(f"Not connected due to {error}")
             self._session = None
+
+    async def close(self) -> None:
+        """Close the HTTP session.
+
+        Pooled connections are released. A new session will be
+        started on next call to ``get_session()``.
+
+        """
+        if self._session is None or self._session.closed:
+            return
+
+        LOGGER.debug("Closing HTTP session")
+        await self._session.close()
+        self._session = None
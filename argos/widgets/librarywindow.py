@@ -1,9 +1,14 @@
 import logging
+import os
 import re
 import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import IntEnum
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from gi.repository import Gio, GLib, GObject, Gtk
 from gi.repository.GdkPixbuf import Pixbuf
@@ -19,6 +24,9 @@ from argos.widgets.utils import default_image_pixbuf, scale_album_image
 
 LOGGER = logging.getLogger(__name__)
 
+PIXBUFS_BATCH_SIZE = 32
+PIXBUFS_BATCH_DELAY = 0.05  # s
+
 
 class DirectoryStoreColumn(IntEnum):
     MARKUP = 0
@@ -26,9 +34,11 @@ class DirectoryStoreColumn(IntEnum):
     URI = 2
     IMAGE_FILE_PATH = 3
     PIXBUF = 4
-    FILTER_TEXT = 5
-    FILTER_TEXT_SECONDARY = 6
-    TYPE = 7
+    TYPE = 5
+    FILTER_ROW_INDEX = 6
+
+
+DIRECTORY_STORE_COLUMN_TYPES = (str, str, str, str, Pixbuf, int, int)
 
 
 class DirectoryItemType(IntEnum):
@@ -38,6 +48,35 @@ class DirectoryItemType(IntEnum):
     TRACK = 4
 
 
+def _log_task_exception(future: Future) -> None:
+    if future.cancelled():
+        return
+
+    error = future.exception()
+    if error is not None:
+        LOGGER.error("Failed to update library store pixbufs", exc_info=error)
+
+
+@lru_cache(maxsize=8192)
+def _build_markup(name: str, artist_name: Optional[str]) -> Tuple[str, str]:
+    if artist_name is not None:
+        elided_escaped_name = GLib.markup_escape_text(elide_maybe(name))
+        elided_escaped_artist_name = GLib.markup_escape_text(elide_maybe(artist_name))
+
+        escaped_name = GLib.markup_escape_text(name)
+        escaped_artist_name = GLib.markup_escape_text(artist_name)
+
+        markup_text = f"<b>{elided_escaped_name}</b>\n{elided_escaped_artist_name}"
+        tooltip_text = f"<b>{escaped_name}</b>\n{escaped_artist_name}"
+    else:
+        escaped_name = GLib.markup_escape_text(name)
+        elided_escaped_name = GLib.markup_escape_text(elide_maybe(name))
+        markup_text = f"<b>{elided_escaped_name}</b>"
+        tooltip_text = f"{escaped_name}"
+
+    return markup_text, tooltip_text
+
+
 @Gtk.Template(resource_path="/io/github/orontee/Argos/ui/library_window.ui")
 class LibraryWindow(Gtk.Box):
     __gtype_name__ = "LibraryWindow"
@@ -57,6 +96,9 @@ class LibraryWindow(Gtk.Box):
         super().__init__()
 
         self._app = application
+        self._filter_needle = ""
+        self._filter_rows: List[Tuple[str, str]] = []
+        # casefolded filter texts, indexed by FILTER_ROW_INDEX column
         self._model = application.model
         self._settings: Gio.Settings = application.props.settings
 
@@ -77,10 +119,7 @@ class LibraryWindow(Gtk.Box):
         self.props.tracks_view = TracksView(application)
         self.library_stack.add_named(self.props.tracks_view, "tracks_view_page")
 
-        directory_store = Gtk.ListStore(str, str, str, str, Pixbuf, str, str, int)
-        self.props.filtered_directory_store = directory_store.filter_new()
-        self.props.filtered_directory_store.set_visible_func(self._filter_row, None)
-        self.directory_view.set_model(self.props.filtered_directory_store)
+        self._set_directory_store(Gtk.ListStore(*DIRECTORY_STORE_COLUMN_TYPES))
 
         self.directory_view.set_markup_column(DirectoryStoreColumn.MARKUP)
         self.directory_view.set_tooltip_column(DirectoryStoreColumn.TOOLTIP)
@@ -101,7 +140,7 @@ class LibraryWindow(Gtk.Box):
             "notify::directory-uri", lambda _1, _2: self._update_store(self._model)
         )
         self._model.connect("directory-completed", self._update_store)
-        self._model.connect("albums-sorted", self._update_store)
+        self._model.connect("albums-sorted", self._on_albums_sorted)
         application.props.download.connect(
             "images-downloaded", self._update_store_pixbufs
         )
@@ -109,8 +148,28 @@ class LibraryWindow(Gtk.Box):
 
         self._ongoing_store_update = threading.Lock()
         self._abort_pixbufs_update = False
+        self._pixbufs_update_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ImagesThread"
+        )
+        self._image_scaling_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="ImageScalingThread"
+        )
+        self._executors_shutdown = False
+        self.connect("destroy", self._on_destroy)
+
+    def _on_destroy(self, _1: Gtk.Widget) -> None:
+        # executors workers are joined at exit, don't let them decode
+        # pending images
+        self._executors_shutdown = True
+        self._abort_pixbufs_update = True
+        for executor in (self._pixbufs_update_executor, self._image_scaling_executor):
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def _init_default_images(self):
+        track_image = default_image_pixbuf(
+            "audio-x-generic",
+            target_width=self.image_size,
+        )
         self._default_images = {
             DirectoryItemType.ALBUM: default_image_pixbuf(
                 "media-optical",
@@ -120,14 +179,8 @@ class LibraryWindow(Gtk.Box):
                 "inode-directory",
                 target_width=self.image_size,
             ),
-            DirectoryItemType.PLAYLIST: default_image_pixbuf(
-                "audio-x-generic",
-                target_width=self.image_size,
-            ),
-            DirectoryItemType.TRACK: default_image_pixbuf(
-                "audio-x-generic",
-                target_width=self.image_size,
-            ),
+            DirectoryItemType.PLAYLIST: track_image,
+            DirectoryItemType.TRACK: track_image,
         }
 
     def _show_progress_box(self) -> None:
@@ -143,47 +196,27 @@ class LibraryWindow(Gtk.Box):
         self,
         model: Union[AlbumModel, DirectoryModel, PlaylistModel, TrackModel],
         type: DirectoryItemType,
-    ) -> Tuple[str, str, str, str, Pixbuf, str, str, int]:
-        artist_name = (
-            model.get_property("artist_name")
-            if model.find_property("artist_name")
-            else None
-        )
-
-        image_path = (
-            str(model.get_property("image_path"))
-            if model.find_property("image_path")
-            else ""
-        )
+        filter_row_index: int,
+    ) -> Tuple[Tuple[str, str, str, str, Pixbuf, int, int], Tuple[str, str]]:
+        name = model.name
+        artist_name = getattr(model, "artist_name", None)
+        image_path = getattr(model, "image_path", None) or ""
+        # properties are exposed as attributes by PyGObject, which
+        # saves the find_property() calls
         pixbuf = self._default_images[type]
+        markup_text, tooltip_text = _build_markup(name, artist_name)
 
-        if artist_name is not None:
-            elided_escaped_name = GLib.markup_escape_text(elide_maybe(model.name))
-            elided_escaped_artist_name = GLib.markup_escape_text(
-                elide_maybe(artist_name)
-            )
-
-            escaped_name = GLib.markup_escape_text(model.name)
-            escaped_artist_name = GLib.markup_escape_text(artist_name)
-
-            markup_text = f"<b>{elided_escaped_name}</b>\n{elided_escaped_artist_name}"
-            tooltip_text = f"<b>{escaped_name}</b>\n{escaped_artist_name}"
-        else:
-            escaped_name = GLib.markup_escape_text(model.name)
-            elided_escaped_name = GLib.markup_escape_text(elide_maybe(model.name))
-            markup_text = f"<b>{elided_escaped_name}</b>"
-            tooltip_text = f"{escaped_name}"
-
-        return (
+        item = (
             markup_text,
             tooltip_text,
             model.uri,
             image_path,
             pixbuf,
-            artist_name or "",
-            model.name,
             type.value,
+            filter_row_index,
         )
+        filter_texts = ((artist_name or "").casefold(), name.casefold())
+        return item, filter_texts
 
     def set_filtering_text(self, text: str) -> None:
         stripped = text.strip()
@@ -191,26 +224,33 @@ class LibraryWindow(Gtk.Box):
             LOGGER.debug(f"Filtering library according to {stripped!r}")
 
             self.props.filtering_text = stripped
+            self._filter_needle = stripped.casefold()
             self.props.filtered_directory_store.refilter()
 
+    def _set_directory_store(self, store: Gtk.ListStore) -> None:
+        filtered_store = store.filter_new()
+        filtered_store.set_visible_func(self._filter_row, None)
+        self.props.filtered_directory_store = filtered_store
+        self.directory_view.set_model(filtered_store)
+
     def _filter_row(
         self,
         model: Gtk.ListStore,
         iter: Gtk.TreeIter,
         data: None,
     ) -> bool:
-        if not self.props.filtering_text:
+        needle = self._filter_needle
+        # empty iff filtering text is, saves a property lookup
+        if not needle:
             return True
 
-        pattern = re.escape(self.props.filtering_text)
-        text = model.get_value(iter, DirectoryStoreColumn.FILTER_TEXT)
-        if re.search(pattern, text, re.IGNORECASE) is not None:
+        index = model.get_value(iter, DirectoryStoreColumn.FILTER_ROW_INDEX)
+        try:
+            text, secondary_text = self._filter_rows[index]
+        except IndexError:
             return True
 
-        secondary_text = model.get_value(
-            iter, DirectoryStoreColumn.FILTER_TEXT_SECONDARY
-        )
-        return re.search(pattern, secondary_text, re.IGNORECASE) is not None
+        return needle in text or needle in secondary_text
 
     def _must_enter_tracks_view(self, directory: DirectoryModel) -> bool:
         applicable = (
@@ -255,20 +295,34 @@ class LibraryWindow(Gtk.Box):
             image_uris: List[Path] = []
             with self._ongoing_store_update:
                 self._abort_pixbufs_update = False
-                store = self.props.filtered_directory_store.get_model()
-                store.clear()
+                store = Gtk.ListStore(*DIRECTORY_STORE_COLUMN_TYPES)
+                # a new store is filled while detached from the
+                # filter, which thus won't be called on each insertion
+                filter_rows: List[Tuple[str, str]] = []
+
+                items = chain.from_iterable(
+                    ((model, item_type) for model in source)
+                    for source, item_type in [
+                        (directory.albums, DirectoryItemType.ALBUM),
+                        (directory.directories, DirectoryItemType.DIRECTORY),
+                        (directory.playlists, DirectoryItemType.PLAYLIST),
+                        (directory.tracks, DirectoryItemType.TRACK),
+                    ]
+                )
 
-                for source, item_type in [
-                    (directory.albums, DirectoryItemType.ALBUM),
-                    (directory.directories, DirectoryItemType.DIRECTORY),
-                    (directory.playlists, DirectoryItemType.PLAYLIST),
-                    (directory.tracks, DirectoryItemType.TRACK),
-                ]:
-                    for model in source:
-                        store.append(self._build_store_item(model, item_type))
+                for model, item_type in items:
+                    item, filter_texts = self._build_store_item(
+                        model, item_type, len(filter_rows)
+                    )
+                    filter_rows.append(filter_texts)
+                    store.append(item)
 
-                        if model.find_property("image_uri"):
-                            image_uris.append(model.get_property("image_uri"))
+                    image_uri = getattr(model, "image_uri", None)
+                    if image_uri is not None:
+                        image_uris.append(image_uri)
+
+                self._filter_rows = filter_rows
+                self._set_directory_store(store)
 
             if len(image_uris) > 0:
                 LOGGER.debug("Will fetch images since directory store was just updated")
@@ -278,16 +332,92 @@ class LibraryWindow(Gtk.Box):
 
         self._hide_progress_box()
 
+    def _on_albums_sorted(self, model: Model) -> None:
+        directory = self._model.get_directory(self.props.directory_uri)
+        if directory is None or len(directory.albums) == 0:
+            return
+
+        if self._ongoing_store_update.locked():
+            self._abort_pixbufs_update = True
+            LOGGER.info("Pixbufs update thread has been requested to abort...")
+
+        new_positions = {album.uri: i for i, album in enumerate(directory.albums)}
+        with self._ongoing_store_update:
+            self._abort_pixbufs_update = False
+            store = self.props.filtered_directory_store.get_model()
+            new_order = list(range(len(store)))
+            # album rows come first, see _update_store()
+
+            moved_count = 0
+            store_iter = store.get_iter_first()
+            while store_iter is not None:
+                uri, raw_library_item_type = store.get(
+                    store_iter,
+                    DirectoryStoreColumn.URI,
+                    DirectoryStoreColumn.TYPE,
+                )
+                if raw_library_item_type != DirectoryItemType.ALBUM:
+                    break
+
+                new_position = new_positions.pop(uri, None)
+                if new_position is None:
+                    break
+
+                new_order[new_position] = moved_count
+                moved_count += 1
+                store_iter = store.iter_next(store_iter)
+
+            reorderable = len(new_positions) == 0 and moved_count == len(
+                directory.albums
+            )
+            if reorderable:
+                LOGGER.debug("Reordering album rows of directory store")
+                store.reorder(new_order)
+
+        if not reorderable:
+            self._update_store(model)
+            return
+
+        self._update_store_pixbufs()
+        # pixbufs update may have been aborted or its pending batches
+        # discarded since rows moved
+
+    def _reset_default_pixbufs(
+        self, previous_default_images: Dict[DirectoryItemType, Pixbuf]
+    ) -> None:
+        if self._ongoing_store_update.locked():
+            self._abort_pixbufs_update = True
+            LOGGER.info("Pixbufs update thread has been requested to abort...")
+
+        with self._ongoing_store_update:
+            self._abort_pixbufs_update = False
+            store = self.props.filtered_directory_store.get_model()
+            store_iter = store.get_iter_first()
+            while store_iter is not None:
+                current_pixbuf, raw_library_item_type = store.get(
+                    store_iter,
+                    DirectoryStoreColumn.PIXBUF,
+                    DirectoryStoreColumn.TYPE,
+                )
+                library_item_type = DirectoryItemType(raw_library_item_type)
+                if current_pixbuf == previous_default_images[library_item_type]:
+                    store.set_value(
+                        store_iter,
+                        DirectoryStoreColumn.PIXBUF,
+                        self._default_images[library_item_type],
+                    )
+                store_iter = store.iter_next(store_iter)
+
     def _update_store_pixbufs(
         self, _1: Optional[GObject.GObject] = None, *, force: bool = False
     ) -> None:
-        thread = threading.Thread(
-            target=self._start_store_pixbufs_update_task,
-            name="ImagesThread",
-            kwargs={"force": force},
-            daemon=True,
+        if self._executors_shutdown:
+            return
+
+        future = self._pixbufs_update_executor.submit(
+            self._start_store_pixbufs_update_task, force=force
         )
-        thread.start()
+        future.add_done_callback(_log_task_exception)
 
     def _start_store_pixbufs_update_task(self, *, force: bool = False) -> None:
         with self._ongoing_store_update:
@@ -299,48 +429,133 @@ class LibraryWindow(Gtk.Box):
 
             store = self.props.filtered_directory_store.get_model()
 
-            def update_pixbuf_at(path: Gtk.TreePath, pixbuf: Pixbuf) -> bool:
-                try:
-                    store_iter = store.get_iter(path)
-                    store.set_value(store_iter, DirectoryStoreColumn.PIXBUF, pixbuf)
-                except Exception as e:
-                    LOGGER.warning("Failed to set pixbuf", exc_info=e)
-                return False
-
+            # hot lookups are bound to locals, columns as plain ints
+            get, get_path, iter_next = store.get, store.get_path, store.iter_next
+            columns = [
+                int(DirectoryStoreColumn.URI),
+                int(DirectoryStoreColumn.IMAGE_FILE_PATH),
+                int(DirectoryStoreColumn.PIXBUF),
+                int(DirectoryStoreColumn.TYPE),
+            ]
+
+            rows: List[Tuple[Gtk.TreePath, str, str, Pixbuf, int]] = []
+            append_row = rows.append
             store_iter = store.get_iter_first()
             while store_iter is not None:
                 if self._abort_pixbufs_update:
                     LOGGER.debug("Aborting update of images")
-                    break
+                    return
 
-                image_path, current_pixbuf, raw_library_item_type = store.get(
-                    store_iter,
-                    DirectoryStoreColumn.IMAGE_FILE_PATH,
-                    DirectoryStoreColumn.PIXBUF,
-                    DirectoryStoreColumn.TYPE,
+                uri, image_path, current_pixbuf, raw_library_item_type = get(
+                    store_iter, *columns
                 )
-                library_item_type = DirectoryItemType(raw_library_item_type)
-                default_image = self._default_images[library_item_type]
-                path = store.get_path(store_iter)
-                if library_item_type in (
-                    DirectoryItemType.ALBUM,
-                    DirectoryItemType.TRACK,
+                append_row(
+                    (
+                        get_path(store_iter),
+                        uri,
+                        image_path,
+                        current_pixbuf,
+                        raw_library_item_type,
+                    )
+                )
+                store_iter = iter_next(store_iter)
+
+            batch: List[Tuple[Gtk.TreePath, str, Optional[Pixbuf]]] = []
+            last_flush = time.monotonic()
+
+            def flush(*, now: bool = False) -> None:
+                nonlocal batch, last_flush
+
+                if len(batch) == 0:
+                    return
+
+                current_time = time.monotonic()
+                if (
+                    now
+                    or len(batch) >= PIXBUFS_BATCH_SIZE
+                    or current_time - last_flush >= PIXBUFS_BATCH_DELAY
                 ):
+                    GLib.idle_add(self._apply_pixbufs_batch, store, batch)
+                    batch = []
+                    last_flush = current_time
+
+            def post(
+                path: Gtk.TreePath,
+                uri: str,
+                pixbuf: Optional[Pixbuf],
+                current_pixbuf: Pixbuf,
+            ) -> None:
+                if pixbuf == current_pixbuf:
+                    return
+
+                batch.append((path, uri, pixbuf))
+                flush()
+
+            default_images = {
+                int(item_type): pixbuf
+                for item_type, pixbuf in self._default_images.items()
+            }
+            with_image_types = (
+                int(DirectoryItemType.ALBUM),
+                int(DirectoryItemType.TRACK),
+            )
+            submit = self._image_scaling_executor.submit
+
+            scalings: Dict[Future, Tuple[Gtk.TreePath, str, Pixbuf]] = {}
+            for path, uri, image_path, current_pixbuf, raw_library_item_type in rows:
+                if self._abort_pixbufs_update:
+                    break
+
+                default_image = default_images[raw_library_item_type]
+                if raw_library_item_type in with_image_types:
                     if image_path:
                         if force or current_pixbuf == default_image:
-                            scaled_pixbuf = scale_album_image(
+                            future = submit(
+                                scale_album_image,
                                 image_path,
                                 target_width=image_size,
                             )
-                            GLib.idle_add(update_pixbuf_at, path, scaled_pixbuf)
+                            scalings[future] = (path, uri, current_pixbuf)
+                        continue
                     else:
-                        uri = store.get_value(store_iter, DirectoryStoreColumn.URI)
                         LOGGER.debug(f"No image path for {uri}")
-                        GLib.idle_add(update_pixbuf_at, path, default_image)
-                else:
-                    GLib.idle_add(update_pixbuf_at, path, default_image)
 
-                store_iter = store.iter_next(store_iter)
+                post(path, uri, default_image, current_pixbuf)
+
+            pending = set(scalings)
+            while len(pending) > 0 and not self._abort_pixbufs_update:
+                done, pending = wait(
+                    pending, timeout=PIXBUFS_BATCH_DELAY, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    path, uri, current_pixbuf = scalings[future]
+                    post(path, uri, future.result(), current_pixbuf)
+                flush()
+
+            if self._abort_pixbufs_update:
+                LOGGER.debug("Aborting update of images")
+                for future in scalings:
+                    future.cancel()
+                return
+
+            flush(now=True)
+
+    def _apply_pixbufs_batch(
+        self,
+        store: Gtk.ListStore,
+        batch: List[Tuple[Gtk.TreePath, str, Optional[Pixbuf]]],
+    ) -> bool:
+        for path, uri, pixbuf in batch:
+            try:
+                store_iter = store.get_iter(path)
+                if store.get_value(store_iter, DirectoryStoreColumn.URI) != uri:
+                    # store changed since the snapshot was taken
+                    continue
+
+                store.set_value(store_iter, DirectoryStoreColumn.PIXBUF, pixbuf)
+            except Exception as e:
+                LOGGER.warning("Failed to set pixbuf", exc_info=e)
+        return False
 
     def is_directory_page_visible(self) -> bool:
         return self.library_stack.get_visible_child_name() == "directory_page"
@@ -428,8 +643,12 @@ class LibraryWindow(Gtk.Box):
 
         self.image_size = image_size
         LOGGER.debug(f"Image size changed to {image_size}")
+        previous_default_images = self._default_images
         self._init_default_images()
+        self._reset_default_pixbufs(previous_default_images)
         self._update_store_pixbufs(force=True)
+        # thumbnails must be scaled to the new size, previously
+        # computed sizes are served by scale_album_image() cache
         self.directory_view.set_item_width(self.image_size)
 
     def on_sort_albums_activated(
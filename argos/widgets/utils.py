@@ -3,7 +3,7 @@ import gettext
 import logging
 from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional, Sequence
+from typing import Callable, Optional, Sequence, Union
 
 from gi.repository import GdkPixbuf, GLib, Gtk
 from gi.repository.GdkPixbuf import Pixbuf
@@ -26,6 +26,7 @@ def tracks_length(tracks: Sequence[TrackModel]) -> int:
     return length
 
 
+@lru_cache(maxsize=32)
 def default_image_pixbuf(icon_name: str, target_width: int) -> Pixbuf:
     pixbuf = Gtk.IconTheme.get_default().load_icon(icon_name, target_width, 0)
     original_width, original_height = pixbuf.get_width(), pixbuf.get_height()
@@ -41,24 +42,23 @@ def default_image_pixbuf(icon_name: str, target_width: int) -> Pixbuf:
     return scaled_pixbuf
 
 
-@lru_cache
-def scale_album_image(image_path: Path, *, target_width: int) -> Optional[Pixbuf]:
-    pixbuf = None
-    try:
-        pixbuf = Pixbuf.new_from_file(str(image_path))
-    except GLib.Error as error:
-        LOGGER.warning(f"Failed to read image at {str(image_path)!r}: {error}")
+def scale_album_image(
+    image_path: Union[str, Path], *, target_width: int
+) -> Optional[Pixbuf]:
+    return _scale_album_image(str(image_path), target_width)
 
-    if pixbuf is None:
-        return None
 
-    width, height = compute_target_size(
-        pixbuf.get_width(),
-        pixbuf.get_height(),
-        target_width=target_width,
-    )
-    scaled_pixbuf = pixbuf.scale_simple(width, height, GdkPixbuf.InterpType.BILINEAR)
-    return scaled_pixbuf
+@lru_cache(maxsize=1024)
+def _scale_album_image(image_path: str, target_width: int) -> Optional[Pixbuf]:
+    # Image is decoded at target size, largest dimension being equal
+    # to target width as with compute_target_size()
+    try:
+        return Pixbuf.new_from_file_at_scale(
+            image_path, target_width, target_width, True
+        )
+    except GLib.Error as error:
+        LOGGER.warning(f"Failed to read image at {image_path!r}: {error}")
+    return None
 
 
 def set_list_box_header_with_separator(
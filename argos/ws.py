@@ -1,11 +1,17 @@
 import asyncio
 import collections.abc
+import itertools
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 from gi.repository import Gio, GObject
 
 if TYPE_CHECKING:
@@ -20,12 +26,32 @@ COMMAND_TIMEOUT: int = 10  # s
 CLOSE_TIMEOUT: int = 10  # s
 CONSECUTIVE_SEND_FAILURE_THRESHOLD = 5
 
-_COMMAND_ID: int = 0
+_COMMAND_ID = itertools.count(1)
+
+_IDEMPOTENT_METHOD_NAMES = ("browse", "as_list", "get_items", "lookup")
+
+
+def is_idempotent(method: str) -> bool:
+    """Tell whether a Mopidy method only reads the server state."""
+    name = method.rsplit(".", 1)[-1]
+    return name.startswith("get_") or name in _IDEMPOTENT_METHOD_NAMES
+
+
+def _loads(data: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
 
-def parse_msg(msg: aiohttp.WSMessage) -> Dict[str, Any]:
+
+def parse_msg(msg: aiohttp.WSMessage) -> Any:
     try:
-        return msg.json()
+        return msg.json(loads=_loads)
     except json.JSONDecodeError:
         LOGGER.error(f"Failed to decode JSON string {msg.data!r}")
         return {}
@@ -67,6 +93,7 @@ class MopidyWSConnection(GObject.GObject):
 
         self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
         self._commands: Dict[int, asyncio.Future] = {}
+        self._pending_reads: Dict[Tuple[str, str], asyncio.Future] = {}
 
     async def send_command(
         self,
@@ -77,6 +104,9 @@ class MopidyWSConnection(GObject.GObject):
     ) -> Optional[Any]:
         """Invoke a JSON-RPC command.
 
+        Identical commands that only read the server state share the
+        response of the one already waiting for a response.
+
         Args:
             method: Method to invoke.
 
@@ -86,14 +116,34 @@ class MopidyWSConnection(GObject.GObject):
             Result of the invoked method.
 
         """
-        global _COMMAND_ID
+        if not is_idempotent(method):
+            return await self._send_command(method, params=params, timeout=timeout)
+
+        key = (method, json.dumps(params, sort_keys=True))
+        pending = self._pending_reads.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._send_command(method, params=params, timeout=timeout)
+            )
+            self._pending_reads[key] = pending
+            pending.add_done_callback(lambda _: self._pending_reads.pop(key, None))
+        else:
+            LOGGER.debug(f"Waiting for pending JSON-RPC command with method {method}")
 
+        return await asyncio.shield(pending)
+
+    async def _send_command(
+        self,
+        method: str,
+        *,
+        params: Optional[dict],
+        timeout: Optional[int],
+    ) -> Optional[Any]:
         if not self._ws:
             LOGGER.warning("Cannot send command!")
             return None
 
-        _COMMAND_ID += 1
-        jsonrpc_id = _COMMAND_ID
+        jsonrpc_id = next(_COMMAND_ID)
 
         if timeout is None:
             timeout = COMMAND_TIMEOUT
@@ -108,7 +158,7 @@ class MopidyWSConnection(GObject.GObject):
         LOGGER.debug(f"Sending JSON-RPC command {jsonrpc_id} with method {method}")
         try:
             try:
-                await asyncio.wait_for(self._ws.send_json(data), timeout)
+                await asyncio.wait_for(self._ws.send_json(data, dumps=_dumps), timeout)
             except ConnectionResetError:
                 LOGGER.warning(
                     f"Connection reset while sending JSON-RPC command {jsonrpc_id}"
@@ -141,18 +191,85 @@ class MopidyWSConnection(GObject.GObject):
             # from self._commands
             result = None
 
-            self._consecutive_send_failures += 1
-            if self._consecutive_send_failures >= CONSECUTIVE_SEND_FAILURE_THRESHOLD:
-                LOGGER.warning(
-                    f"Closing Mopidy websocket connection after >{CONSECUTIVE_SEND_FAILURE_THRESHOLD} consecutive send failures"
-                )
-                await self._close_ws()
-                self._consecutive_send_failures = 0
+            await self._record_send_failure()
         else:
             self._consecutive_send_failures = 0
 
         return result
 
+    async def send_commands(
+        self,
+        *commands: Tuple[str, Optional[dict]],
+        timeout: int = None,
+    ) -> Optional[List[Optional[Any]]]:
+        """Invoke JSON-RPC commands as a single batch.
+
+        All commands are sent through one message and Mopidy answers
+        with one message, thus saving round trips when commands don't
+        depend on each other results.
+
+        Args:
+            commands: Pairs of method to invoke and parameters of the
+                JSON-RPC command.
+
+        Returns:
+            Results of the invoked methods, in the order of
+            ``commands``, or ``None`` on failure.
+
+        """
+        if not self._ws:
+            LOGGER.warning("Cannot send commands!")
+            return None
+
+        if timeout is None:
+            timeout = COMMAND_TIMEOUT
+
+        batch: List[Dict[str, Any]] = []
+        futures: Dict[int, asyncio.Future] = {}
+        for method, params in commands:
+            jsonrpc_id = next(_COMMAND_ID)
+
+            data = {"jsonrpc": "2.0", "id": jsonrpc_id, "method": method}
+            if params is not None:
+                data["params"] = params
+            batch.append(data)
+
+            future: asyncio.Future = asyncio.Future()
+            self._commands[jsonrpc_id] = future
+            futures[jsonrpc_id] = future
+
+        jsonrpc_ids = list(futures.keys())
+        LOGGER.debug(f"Sending batch of JSON-RPC commands {jsonrpc_ids}")
+        try:
+            await asyncio.wait_for(self._ws.send_json(batch, dumps=_dumps), timeout)
+            results = await asyncio.wait_for(asyncio.gather(*futures.values()), timeout)
+        except (
+            ConnectionResetError,
+            asyncio.exceptions.TimeoutError,
+            asyncio.exceptions.CancelledError,
+        ) as error:
+            LOGGER.warning(
+                f"Batch of JSON-RPC commands {jsonrpc_ids} failed: {error!r}"
+            )
+            for jsonrpc_id, future in futures.items():
+                self._commands.pop(jsonrpc_id, None)
+                future.cancel()
+
+            await self._record_send_failure()
+            return None
+
+        self._consecutive_send_failures = 0
+        return list(results)
+
+    async def _record_send_failure(self) -> None:
+        self._consecutive_send_failures += 1
+        if self._consecutive_send_failures >= CONSECUTIVE_SEND_FAILURE_THRESHOLD:
+            LOGGER.warning(
+                f"Closing Mopidy websocket connection after >{CONSECUTIVE_SEND_FAILURE_THRESHOLD} consecutive send failures"
+            )
+            await self._close_ws()
+            self._consecutive_send_failures = 0
+
     def cancel_commands(self) -> None:
         for jsonrpc_id in list(self._commands.keys()):
             LOGGER.debug(f"Cancelling JSON-RPC command {jsonrpc_id}")
@@ -221,32 +338,24 @@ class MopidyWSConnection(GObject.GObject):
         When ``msg`` is a text message, then it is parsed. If the
         parsed message has an ``"event"`` key, then it is passed to
         the event handler; Otherwise, it tries to identify a JSON-RPC
-        command the message is the response from.
+        command the message is the response from. A parsed list is
+        the response to a batch of commands.
 
         When ``msg`` isn't a text message, it simply logs.
 
         """
         if msg.type == aiohttp.WSMsgType.TEXT:
             parsed = parse_msg(msg)
+            if isinstance(parsed, list):
+                for response in parsed:
+                    self._handle_response(response)
+                return
+
             if "event" in parsed:
                 await self._event_handler(parsed)
                 return
 
-            jsonrpc_id = parsed.get("id") if "jsonrpc" in parsed else None
-            if jsonrpc_id:
-                future = self._commands.pop(jsonrpc_id, None)
-                # the default None value must be provided since, if
-                # the future is cancelled due to connection reset or
-                # timeout, then it may have been removed from
-                # self._commands
-                if future:
-                    LOGGER.debug(f"Received result of JSON-RPC command {jsonrpc_id}")
-                    future.set_result(parsed.get("result"))
-                    return
-                else:
-                    LOGGER.debug(f"Unknown JSON-RPC command {jsonrpc_id}")
-            else:
-                LOGGER.debug(f"Message without id nor event {parsed!r}")
+            self._handle_response(parsed)
 
         elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
             LOGGER.warning(f"Unexpected message {msg!r}")
@@ -254,6 +363,21 @@ class MopidyWSConnection(GObject.GObject):
         elif msg.type == aiohttp.WSMsgType.CLOSE:
             LOGGER.info(f"Close received with code {msg.data!r}, " f"{msg.extra!r}")
 
+    def _handle_response(self, parsed: Dict[str, Any]) -> None:
+        jsonrpc_id = parsed.get("id") if "jsonrpc" in parsed else None
+        if jsonrpc_id:
+            future = self._commands.pop(jsonrpc_id, None)
+            # the default None value must be provided since, if the
+            # future is cancelled due to connection reset or timeout,
+            # then it may have been removed from self._commands
+            if future and not future.done():
+                LOGGER.debug(f"Received result of JSON-RPC command {jsonrpc_id}")
+                future.set_result(parsed.get("result"))
+            else:
+                LOGGER.debug(f"Unknown JSON-RPC command {jsonrpc_id}")
+        else:
+            LOGGER.debug(f"Message without id nor event {parsed!r}")
+
     def _on_mopidy_base_url_changed(
         self,
         settings: Gio.Settings,